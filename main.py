@@ -11,6 +11,7 @@ from services.valueserp_service import ValueSerpService
 from services.seo_analyzer import SEOAnalyzer
 from services.cache_service import cache_service
 from typing import Optional, List, Dict, Any
+from contextlib import asynccontextmanager
 import time
 from config import settings
 
@@ -47,13 +48,20 @@ if _sentry_dsn:
 # Configuration du sous-chemin - Forcer à vide car reverse proxy gère le préfixe
 ROOT_PATH = ""  # os.getenv("ROOT_PATH", "")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Arrêt : fermeture du pool de connexions HTTP partagé (ValueSERP + scraping)
+    await valueserp_service.aclose()
+
 # Application principale
 app = FastAPI(
     title="API d'Analyse Sémantique SEO",
     description="API complète pour l'analyse sémantique SEO - Compatible avec tous vos outils",
     version="2.0.0",
     docs_url=f"{ROOT_PATH}/docs",
-    redoc_url=f"{ROOT_PATH}/redoc"
+    redoc_url=f"{ROOT_PATH}/redoc",
+    lifespan=lifespan
 )
 
 # Sous-router pour gérer le préfixe
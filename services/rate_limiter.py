@@ -0,0 +1,63 @@
+"""
+Limiteurs de débit (token bucket) pour les appels sortants
+Protège l'API ValueSERP et les sites scrapés des rafales de requêtes concurrentes (erreurs 429)
+"""
+import asyncio
+import time
+from typing import Dict
+
+
+class RateLimiter:
+    """Token bucket : `rate` requêtes/seconde en régime établi, rafales jusqu'à `capacity`"""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+
+    async def acquire(self):
+        """Attend qu'un jeton soit disponible puis le consomme"""
+        # Réservation sans verrou : lecture et mise à jour du seau se font sans await entre les deux,
+        # un solde négatif représente les jetons déjà promis aux appelants en attente
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+        self._tokens -= 1
+
+        if self._tokens < 0:
+            try:
+                await asyncio.sleep(-self._tokens / self.rate)
+            except asyncio.CancelledError:
+                # Appelant annulé avant sa requête : le jeton réservé est rendu aux suivants
+                self._tokens = min(self.capacity, self._tokens + 1)
+                raise
+
+    def is_idle(self) -> bool:
+        """True si le seau est plein (aucune requête récente à lisser)"""
+        elapsed = time.monotonic() - self._updated_at
+        return self._tokens + elapsed * self.rate >= self.capacity
+
+
+class DomainRateLimiter:
+    """Un token bucket par domaine (netloc) : limite la cadence vers chaque site sans brider les autres"""
+
+    # Au-delà de ce nombre de domaines suivis, les seaux inactifs sont oubliés
+    MAX_TRACKED_DOMAINS = 1024
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity
+        self._limiters: Dict[str, RateLimiter] = {}
+
+    async def acquire(self, domain: str):
+        """Attend qu'une requête vers `domain` soit autorisée"""
+        limiter = self._limiters.get(domain)
+        if limiter is None:
+            if len(self._limiters) >= self.MAX_TRACKED_DOMAINS:
+                self._limiters = {
+                    name: bucket for name, bucket in self._limiters.items() if not bucket.is_idle()
+                }
+            limiter = self._limiters[domain] = RateLimiter(self.rate, self.capacity)
+
+        await limiter.acquire()
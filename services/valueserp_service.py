@@ -1,19 +1,215 @@
 import httpx
+import codecs
 import os
-from typing import Dict, List, Any
+import logging
+from functools import lru_cache
+from urllib.parse import urlparse
+from typing import Dict, List, Any, Optional
 import asyncio
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 import trafilatura
 from trafilatura.settings import use_config
 from trafilatura import extract_metadata
 from .cache_service import cache_service
+from .rate_limiter import RateLimiter, DomainRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Import optionnel de selectolax (parseur Lexbor en C, bien plus rapide que BeautifulSoup)
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    LexborHTMLParser = None
+    SELECTOLAX_AVAILABLE = False
+
+# HTTP/2 (multiplexage des requêtes vers un même hôte/CDN) si l'extra httpx[http2] est installé
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Champ texte lu pour chaque élément SERP (le premier présent l'emporte)
+_PAA_FIELDS = ("question", "title")
+_RELATED_SEARCH_FIELDS = ("query", "title")
+_INLINE_VIDEO_FIELDS = ("title", "link", "thumbnail", "duration", "source")
+_MISSING = object()
+
+def _first_field(item: Dict[str, Any], fields) -> Any:
+    """Valeur du premier champ présent dans l'élément (même vide), _MISSING si aucun"""
+    for field in fields:
+        if field in item:
+            return item[field]
+    return _MISSING
+
+def _related_search_text(item: Any) -> Any:
+    """Texte d'une recherche associée (chaîne brute ou dict), _MISSING pour tout autre type"""
+    if isinstance(item, str):
+        return item
+    if isinstance(item, dict):
+        return _first_field(item, _RELATED_SEARCH_FIELDS)
+    return _MISSING
+
+# Balises comptées dans les statistiques HTML → clé du compteur correspondant
+_STATS_TAG_KEYS = {
+    'img': 'images',
+    'table': 'tables',
+    'ul': 'lists', 'ol': 'lists',
+    'video': 'videos', 'iframe': 'videos',
+    'h1': 'titles', 'h2': 'titles', 'h3': 'titles', 'h4': 'titles', 'h5': 'titles', 'h6': 'titles'
+}
+_STATS_TAGS = ['a', *_STATS_TAG_KEYS]
+# Les liens sans attribut href sont écartés par le sélecteur lui-même (filtrage côté C)
+_STATS_SELECTOR = ', '.join(['a[href]', *_STATS_TAG_KEYS])
+_FIRST_HEADING_TAGS = ('h1', 'h2', 'h3')
+# Fallback BeautifulSoup : seules ces balises (et leur contenu) sont construites, le reste du DOM est ignoré
+_STATS_STRAINER = SoupStrainer(_STATS_TAGS)
+
+# Nombre maximum de pages scrapées simultanément pour une même requête SERP
+_MAX_CONCURRENT_FETCHES = 10
+
+# Paramètres ValueSERP identiques pour toutes les requêtes (complétés par requête : clé, q, location, hl, num)
+_BASE_SERP_PARAMS = {
+    "google_domain": "google.fr",
+    "gl": "fr",
+    "device": "desktop",
+    "include_answer_box": "true",
+    "include_people_also_ask": "true"
+}
+
+# Hôtes jamais scrapés (réseaux sociaux, vidéo) : pas de texte SEO exploitable, sous-domaines inclus
+_SKIP_HOSTS = frozenset({
+    'youtube.com', 'facebook.com', 'twitter.com', 'x.com', 'instagram.com', 'linkedin.com'
+})
+
+def _is_skipped_host(domain: str) -> bool:
+    """True si le domaine (ou l'un de ses domaines parents, ex. fr.linkedin.com) est dans _SKIP_HOSTS"""
+    host = domain.lower()
+    while host:
+        if host in _SKIP_HOSTS:
+            return True
+        host = host.partition('.')[2]
+    return False
+
+# Cadences maximales (requêtes/seconde) : API ValueSERP et chaque site scrapé
+_SERP_API_RATE = 5
+_SCRAPE_RATE_PER_DOMAIN = 2
+
+# Taille maximale lue pour une page : au-delà, le HTML n'apporte rien à l'analyse SEO
+_MAX_PAGE_BYTES = 512 * 1024
+
+# Réponses analysées : types MIME HTML, et taille annoncée au-delà de laquelle la page est ignorée
+_HTML_CONTENT_TYPES = frozenset({'text/html', 'application/xhtml+xml'})
+_MAX_CONTENT_LENGTH = 2_000_000
+
+def _has_min_words(text: str, min_words: int) -> bool:
+    """True si le texte contient au moins min_words mots (au plus min_words morceaux créés, au lieu d'un split complet)"""
+    return len(text.split(None, min_words - 1)) >= min_words
+
+# Configurations trafilatura construites une fois (use_config() relit le fichier settings.cfg à chaque appel)
+# Lecture seule après l'import : partagées sans risque entre les threads de _PARSE_POOL
+_PRECISE_CONFIG = use_config()
+_PRECISE_CONFIG.set('DEFAULT', 'EXTRACTION_TIMEOUT', '30')
+
+_AGGRESSIVE_CONFIG = use_config()
+_AGGRESSIVE_CONFIG.set('DEFAULT', 'MIN_EXTRACTED_SIZE', '25')  # Seuil plus bas
+_AGGRESSIVE_CONFIG.set('DEFAULT', 'MIN_OUTPUT_SIZE', '25')
+
+# Options de trafilatura.extract pour chaque mode
+_PRECISE_EXTRACT_KWARGS = dict(
+    include_comments=False,
+    include_tables=True,
+    include_links=False,
+    include_images=False,
+    include_formatting=False,
+    output_format='txt',
+    target_language='fr',
+    deduplicate=True,
+    favor_precision=True
+)
+
+_AGGRESSIVE_EXTRACT_KWARGS = dict(
+    include_comments=False,
+    include_tables=True,
+    include_links=True,        # INCLURE LIENS
+    include_images=False,
+    include_formatting=True,   # INCLURE FORMATAGE
+    output_format='txt',
+    target_language=None,      # PAS DE FILTRE LANGUE
+    deduplicate=False,         # PAS DE DÉDUPLICATION
+    favor_precision=False,     # PRIVILÉGIER RAPPEL
+    favor_recall=True
+)
+
+# Pool de threads dédié au parsing HTML (lxml/Lexbor libèrent le GIL pendant le parsing)
+_PARSE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="html-parse")
+
+# Nombre de mots au-delà duquel le texte d'une page n'est plus collecté (fallback BeautifulSoup)
+_MAX_TEXT_WORDS = 10_000
+
+# OPTIMISÉ : Timeout réduit à 10s (5s connexion + 10s total) pour le scraping des pages
+_PAGE_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+# Headers améliorés pour éviter blocage (portés par le client partagé, hérités par chaque requête)
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+_DEFAULT_HEADERS = {
+    'User-Agent': _USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'fr-FR,fr;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# Client HTTP partagé : pool de connexions keep-alive réutilisé par tous les appels (API + scraping)
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Retourne le client HTTP partagé, créé au premier appel (ou recréé s'il a été fermé)"""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            timeout=httpx.Timeout(15.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=300),
+            follow_redirects=True,
+            http2=HTTP2_AVAILABLE,
+            headers=_DEFAULT_HEADERS
+        )
+    return _HTTP_CLIENT
 
 class ValueSerpService:
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.api_key = os.getenv("VALUESERP_API_KEY") or os.getenv("SERP_API_KEY")
         self.base_url = "https://api.valueserp.com/search"
+        # Client HTTP injecté (tests, app) ; par défaut le client partagé du module (qui porte _DEFAULT_HEADERS)
+        self._client = client
+        # Scraping en cours par URL : les appels concurrents sur une même page partagent une seule requête
+        self._inflight_fetches: Dict[str, asyncio.Task] = {}
+        # Limiteurs de débit : évite les 429 de ValueSERP et des sites lors du scraping parallèle
+        self._serp_rate_limiter = RateLimiter(_SERP_API_RATE)
+        self._scrape_rate_limiter = DomainRateLimiter(_SCRAPE_RATE_PER_DOMAIN)
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Client HTTP utilisé pour l'API ValueSERP et le scraping des pages"""
+        return self._client if self._client is not None else get_http_client()
+    
+    async def aclose(self):
+        """Ferme le pool de connexions (à appeler à l'arrêt de l'application)"""
+        client = self._get_client()
+        if not client.is_closed:
+            await client.aclose()
+    
+    async def __aenter__(self) -> "ValueSerpService":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
         
-    async def get_serp_data(self, query: str, location: str = "France", language: str = "fr", num_results: int = 20) -> Dict[str, Any]:
+    async def get_serp_data(self, query: str, location: str = "France", language: str = "fr", num_results: int = 20,
+                            no_cache: bool = False) -> Dict[str, Any]:
         """
         Récupère les données SERP via ValueSERP API avec cache 7 jours
 
@@ -22,130 +218,143 @@ class ValueSerpService:
             location: Localisation géographique (ex: "France")
             language: Code langue (ex: "fr")
             num_results: Nombre de résultats à récupérer (10-30)
+            no_cache: Ignore le cache en lecture (le résultat frais remplace l'entrée existante)
 
         Returns:
             Dictionnaire contenant organic_results, paa, related_searches, inline_videos
         """
         
-        # 🚀 CACHE: Vérification du cache d'abord
-        cached_result = cache_service.get("serp", query, location, language, num_results)
-        if cached_result is not None:
-            print(f"📦 Cache HIT: SERP '{query}' (économie API + scraping)")
-            return cached_result
+        # 🚀 CACHE: Vérification du cache d'abord (clé normalisée : "Agence SEO " et "agence seo" partagent l'entrée)
+        cache_query = self._normalize_cache_query(query)
+        if not no_cache:
+            cached_result = cache_service.get("serp", cache_query, location, language, num_results)
+            if cached_result is not None:
+                logger.debug("📦 Cache HIT: SERP '%s' (économie API + scraping)", query)
+                return cached_result
 
         params = {
+            **_BASE_SERP_PARAMS,
             "api_key": self.api_key,
             "q": query,
             "location": location,
-            "google_domain": "google.fr",
-            "gl": "fr",
             "hl": language,
-            "num": num_results,  # MODIFIÉ : dynamique au lieu de 10
-            "device": "desktop",
-            "include_answer_box": "true",
-            "include_people_also_ask": "true"
+            "num": num_results  # MODIFIÉ : dynamique au lieu de 10
         }
         
         # Vérification de la clé API
         if not self.api_key:
-            error_msg = "❌ ERREUR: Clé API ValueSERP manquante!"
-            print(error_msg)
-            print("Créez un fichier .env avec: SERP_API_KEY=votre_clé")
-            print("Ou configurez la variable d'environnement VALUESERP_API_KEY")
+            logger.warning(
+                "❌ ERREUR: Clé API ValueSERP manquante! Créez un fichier .env avec: SERP_API_KEY=votre_clé "
+                "ou configurez la variable d'environnement VALUESERP_API_KEY"
+            )
             raise Exception("Clé API ValueSERP non configurée. Vérifiez votre fichier .env")
         
-        print(f"🔍 Recherche SERP pour: {query}")
-        print(f"🔑 Clé API configurée: {self.api_key[:10]}...")
+        logger.debug("🔍 Recherche SERP pour: %s", query)
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.get(self.base_url, params=params)
-                print(f"📡 Statut réponse: {response.status_code}")
-                response.raise_for_status()
-                serp_data = response.json()
-                
-                # Debug des données reçues
-                print(f"📊 Données reçues - organic_results: {len(serp_data.get('organic_results', []))}")
-                print(f"📊 Données reçues - people_also_ask: {len(serp_data.get('people_also_ask', []))}")
-                
-                # Debug des données (commenté pour éviter les problèmes de fichiers)
-                # import json
-                # try:
-                #     with open('debug_serp_data.json', 'w', encoding='utf-8') as f:
-                #         json.dump(serp_data, f, indent=2, ensure_ascii=False)
-                #     print("📄 Données SERP exportées dans debug_serp_data.json")
-                # except:
-                #     pass
-                
-                if not serp_data.get('organic_results'):
-                    error_msg = f"⚠️ Aucun résultat organique trouvé pour '{query}'"
-                    print(error_msg)
-                    print("Vérifiez que votre clé API ValueSERP est valide et active")
-                    raise Exception(f"Aucun résultat SERP trouvé pour la requête: {query}")
-
-                # ⭐ NOUVEAU : Utiliser le scraping parallèle
-                organic_results = await self._process_serp_results_parallel(serp_data, num_results)
-                
-                # Extraction de tous les éléments SERP
-                paa_questions = self._extract_paa(serp_data)
-                related_searches = self._extract_related_searches(serp_data)
-                inline_videos = self._extract_inline_videos(serp_data)
-                
-                final_result = {
-                    'organic_results': organic_results,
-                    'paa': paa_questions,
-                    'related_searches': related_searches,
-                    'inline_videos': inline_videos
-                }
-                
-                # 💾 CACHE: Stocker le résultat pour 7 jours
-                cache_service.set("serp", final_result, query, location, language, num_results)
-                print(f"💾 Cache MISS: SERP '{query}' → stocké 7j")
-                
-                return final_result
-                
-            except httpx.HTTPError as e:
-                error_msg = f"Erreur HTTP lors de l'appel à ValueSERP: {e}"
-                print(error_msg)
-                print("Vérifiez votre clé API ValueSERP dans le fichier .env")
-                print("Ou vérifiez votre connexion internet")
-                raise Exception(f"Erreur de connexion à l'API ValueSERP: {e}")
-            except Exception as e:
-                error_msg = f"Erreur générale lors de l'appel ValueSERP: {e}"
-                print(error_msg)
-                if 'serp_data' in locals():
-                    print(f"Données reçues: {serp_data}")
-                raise Exception(f"Erreur lors de l'analyse SERP: {e}")
+        client = self._get_client()
+        try:
+            await self._serp_rate_limiter.acquire()
+            response = await client.get(self.base_url, params=params, timeout=30.0)
+            logger.debug("📡 Statut réponse: %s", response.status_code)
+            response.raise_for_status()
+            serp_data = response.json()
+            
+            # Debug des données reçues
+            logger.debug(
+                "📊 Données reçues - organic_results: %d, people_also_ask: %d",
+                len(serp_data.get('organic_results', [])), len(serp_data.get('people_also_ask', []))
+            )
+            
+            # Debug des données (commenté pour éviter les problèmes de fichiers)
+            # import json
+            # try:
+            #     with open('debug_serp_data.json', 'w', encoding='utf-8') as f:
+            #         json.dump(serp_data, f, indent=2, ensure_ascii=False)
+            #     print("📄 Données SERP exportées dans debug_serp_data.json")
+            # except:
+            #     pass
+            
+            if not serp_data.get('organic_results'):
+                logger.warning(
+                    "⚠️ Aucun résultat organique trouvé pour '%s'. Vérifiez que votre clé API ValueSERP est valide et active",
+                    query
+                )
+                raise Exception(f"Aucun résultat SERP trouvé pour la requête: {query}")
+
+            # ⭐ NOUVEAU : Utiliser le scraping parallèle
+            organic_results = await self._process_serp_results_parallel(serp_data, num_results)
+            
+            # Extraction de tous les éléments SERP
+            paa_questions = self._extract_paa(serp_data)
+            related_searches = self._extract_related_searches(serp_data)
+            inline_videos = self._extract_inline_videos(serp_data)
+            
+            final_result = {
+                'organic_results': organic_results,
+                'paa': paa_questions,
+                'related_searches': related_searches,
+                'inline_videos': inline_videos
+            }
+            
+            # 💾 CACHE: Stocker le résultat pour 7 jours
+            cache_service.set("serp", final_result, cache_query, location, language, num_results)
+            logger.debug("💾 Cache MISS: SERP '%s' → stocké 7j", query)
+            
+            return final_result
+            
+        except httpx.HTTPError as e:
+            logger.error(
+                "Erreur HTTP lors de l'appel à ValueSERP: %s. Vérifiez votre clé API ValueSERP dans le fichier .env "
+                "ou votre connexion internet", e
+            )
+            raise Exception(f"Erreur de connexion à l'API ValueSERP: {e}")
+        except Exception as e:
+            logger.error("Erreur générale lors de l'appel ValueSERP: %s", e)
+            if 'serp_data' in locals():
+                logger.debug("Données reçues: %s", serp_data)
+            raise Exception(f"Erreur lors de l'analyse SERP: {e}")
     
-    async def _process_serp_results(self, serp_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Traite les résultats SERP pour extraire les informations nécessaires (DEPRECATED - utiliser _process_serp_results_parallel)"""
-        results = []
-
-        if "organic_results" in serp_data:
-            for result in serp_data["organic_results"]:
-                processed_result = {
-                    "position": result.get("position", 0),
-                    "title": result.get("title", ""),
-                    "url": result.get("link", ""),
-                    "snippet": result.get("snippet", ""),
-                    "domain": self._extract_domain(result.get("link", "")),
-                }
+    async def get_serp_data_many(self, queries: List[str], location: str = "France", language: str = "fr",
+                                 num_results: int = 20, concurrency: int = 8) -> List[Any]:
+        """
+        Récupère les données SERP de plusieurs requêtes en parallèle (client HTTP, cache et limiteurs partagés)
 
-                # Récupération du contenu de la page
-                content_data = await self._fetch_page_content(result.get("link", ""))
-                processed_result.update(content_data)
+        Args:
+            queries: Requêtes de recherche
+            location: Localisation géographique (ex: "France")
+            language: Code langue (ex: "fr")
+            num_results: Nombre de résultats à récupérer par requête
+            concurrency: Nombre maximum de requêtes SERP traitées en même temps
+
+        Returns:
+            Une entrée par requête, dans l'ordre : le dictionnaire de get_serp_data, ou l'exception levée
+        """
+        semaphore = asyncio.Semaphore(concurrency)
 
-                results.append(processed_result)
+        async def fetch(query: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get_serp_data(query, location, language, num_results)
 
-        return results
+        return await asyncio.gather(*(fetch(query) for query in queries), return_exceptions=True)
+    
+    def _normalize_cache_query(self, query: str) -> str:
+        """Forme canonique d'une requête pour la clé de cache SERP (casse et espaces ignorés)"""
+        return " ".join(query.split()).lower()
+    
+    async def _process_serp_results(self, serp_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Traite les résultats SERP pour extraire les informations nécessaires (DEPRECATED - utiliser _process_serp_results_parallel)"""
+        # Ancienne version séquentielle : délègue au scraping parallèle (mêmes données, latence ≈ la page la plus lente)
+        return await self._process_serp_results_parallel(serp_data, len(serp_data.get("organic_results", [])))
 
-    async def _process_serp_results_parallel(self, serp_data: Dict[str, Any], max_results: int = 10) -> List[Dict[str, Any]]:
+    async def _process_serp_results_parallel(self, serp_data: Dict[str, Any], max_results: int = 10,
+                                             concurrency: int = _MAX_CONCURRENT_FETCHES) -> List[Dict[str, Any]]:
         """
         Traite les résultats SERP en PARALLÈLE pour extraire les informations nécessaires
 
         Args:
             serp_data: Données brutes de ValueSERP
             max_results: Nombre maximum de résultats à traiter (10 ou 20)
+            concurrency: Nombre maximum de pages récupérées en même temps
 
         Returns:
             Liste des résultats traités avec contenu extrait
@@ -155,7 +364,8 @@ class ValueSerpService:
 
         organic_results = serp_data["organic_results"][:max_results]
 
-        # Création des tâches parallèles
+        # Création des tâches parallèles (plafonnées par un sémaphore)
+        semaphore = asyncio.Semaphore(concurrency)
         tasks = []
         for result in organic_results:
             base_data = {
@@ -166,19 +376,22 @@ class ValueSerpService:
                 "domain": self._extract_domain(result.get("link", "")),
             }
 
-            # Tâche de scraping pour cette page
-            task = self._fetch_and_merge_content(result.get("link", ""), base_data)
+            # Tâche de scraping pour cette page (sauf hôtes sans contenu exploitable : métadonnées SERP seules)
+            if _is_skipped_host(base_data["domain"]):
+                task = self._skipped_page_content(base_data)
+            else:
+                task = self._fetch_with_semaphore(semaphore, result.get("link", ""), base_data)
             tasks.append(task)
 
         # Exécution en PARALLÈLE
-        print(f"🚀 Lancement du scraping parallèle de {len(tasks)} pages...")
+        logger.debug("🚀 Lancement du scraping parallèle de %d pages...", len(tasks))
         import time
         start_time = time.time()
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         elapsed = time.time() - start_time
-        print(f"✅ Scraping parallèle terminé en {elapsed:.2f}s")
+        logger.debug("✅ Scraping parallèle terminé en %.2fs", elapsed)
 
         # Filtrage des erreurs
         valid_results = []
@@ -187,7 +400,7 @@ class ValueSerpService:
         for i, result in enumerate(results):
             if isinstance(result, Exception):
                 error_count += 1
-                print(f"⚠️ Erreur page #{i+1}: {str(result)[:100]}")
+                logger.warning("⚠️ Erreur page #%d: %.100s", i + 1, result)
                 # Ajouter un résultat vide pour maintenir la cohérence
                 valid_results.append({
                     "position": i + 1,
@@ -218,10 +431,20 @@ class ValueSerpService:
             else:
                 valid_results.append(result)
 
-        print(f"📊 Résultats valides: {len(valid_results) - error_count}/{len(results)}")
+        logger.debug("📊 Résultats valides: %d/%d", len(valid_results) - error_count, len(results))
 
         return valid_results
 
+    async def _skipped_page_content(self, base_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Résultat d'une page non scrapée (hôte ignoré) : données SERP et statistiques vides"""
+        logger.debug("⏭️ Hôte ignoré, pas de scraping: %s", base_data["domain"])
+        return {**base_data, **self._empty_page_content("skipped")}
+    
+    async def _fetch_with_semaphore(self, semaphore: asyncio.Semaphore, url: str, base_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Récupère une page en respectant la limite de requêtes simultanées"""
+        async with semaphore:
+            return await self._fetch_and_merge_content(url, base_data)
+    
     async def _fetch_and_merge_content(self, url: str, base_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Récupère le contenu d'une page et fusionne avec les données de base
@@ -231,7 +454,7 @@ class ValueSerpService:
             content_data = await self._fetch_page_content(url)
             return {**base_data, **content_data}
         except Exception as e:
-            print(f"❌ Erreur scraping {url}: {str(e)[:50]}")
+            logger.warning("❌ Erreur scraping %s: %.50s", url, e)
             # Retourner données de base sans contenu
             return {
                 **base_data,
@@ -261,93 +484,121 @@ class ValueSerpService:
         # 🚀 CACHE: Vérification du cache d'abord  
         cached_content = cache_service.get("content", url)
         if cached_content is not None:
-            print(f"📦 Cache HIT: {url[:50]}...")
+            logger.debug("📦 Cache HIT: %.50s...", url)
             return cached_content
 
-        # OPTIMISÉ : Timeout réduit à 10s (5s connexion + 10s total)
-        timeout = httpx.Timeout(10.0, connect=5.0)
-
-        # Headers améliorés pour éviter blocage
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'fr-FR,fr;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
-
+        fetch_task = self._inflight_fetches.get(url)
+        if fetch_task is None:
+            fetch_task = asyncio.ensure_future(self._download_page_content(url))
+            self._inflight_fetches[url] = fetch_task
+            fetch_task.add_done_callback(lambda _task: self._inflight_fetches.pop(url, None))
+        else:
+            logger.debug("🔗 Scraping déjà en cours, requête partagée: %.50s...", url)
+        
+        # shield : l'annulation d'un appelant n'interrompt pas la requête des autres
+        return await asyncio.shield(fetch_task)
+    
+    async def _download_page_content(self, url: str) -> Dict[str, Any]:
+        """Télécharge et analyse une page (sans lecture du cache ; le résultat valide y est stocké)"""
         try:
-            print(f"🔍 Récupération: {url[:60]}...")
-            async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-                response = await client.get(url, headers=headers)
-                
-                if response.status_code == 200:
-                    html_content = response.text
-                    
-                    # NOUVELLE APPROCHE: Extraction avec trafilatura + métadonnées
-                    main_content = self._extract_content_with_trafilatura(html_content, url)
-                    metadata = self._extract_metadata_with_trafilatura(html_content)
-                    
-                    # BeautifulSoup uniquement pour les statistiques HTML
-                    soup = BeautifulSoup(html_content, 'html.parser')
-                    
-                    # Comptage des mots basé sur le contenu extrait par trafilatura
-                    word_count = len(main_content.split()) if main_content else 0
-                    
-                    # Validation améliorée de la qualité
-                    content_quality = self._validate_content_quality_v2(main_content, word_count, metadata)
-                    
-                    result = {
-                        # Métadonnées extraites par trafilatura
-                        "h1": metadata.get('title') or self._extract_h1(soup),
-                        "h2": self._extract_h2(soup),  # Garde l'ancienne méthode pour H2/H3
-                        "h3": self._extract_h3(soup),
-                        
-                        # Contenu principal (trafilatura)
-                        "content": main_content,
-                        "word_count": word_count,
-                        
-                        # Métadonnées enrichies
-                        "author": metadata.get('author', ''),
-                        "date": metadata.get('date', ''),
-                        "description": metadata.get('description', ''),
-                        "sitename": metadata.get('sitename', ''),
-                        "language": metadata.get('language', 'fr'),
-                        
-                        # Statistiques HTML (BeautifulSoup)
-                        "internal_links": len(soup.find_all('a', href=lambda x: x and not x.startswith('http'))),
-                        "external_links": len(soup.find_all('a', href=lambda x: x and x.startswith('http'))),
-                        "images": len(soup.find_all('img')),
-                        "tables": len(soup.find_all('table')),
-                        "lists": len(soup.find_all(['ul', 'ol'])),
-                        "videos": len(soup.find_all(['video', 'iframe'])),
-                        "titles": len(soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])),
-                        
-                        # Qualité calculée
-                        "content_quality": content_quality
-                    }
-                    
-                    print(f"✅ OK: {word_count} mots, qualité: {content_quality}")
-                    
-                    # 💾 CACHE: Stocker le contenu si valide
-                    if word_count > 0:
-                        cache_service.set("content", result, url)
-                        print(f"💾 Cache MISS: {url[:50]}... → stocké 7j")
-                    
-                    return result
-                else:
-                    print(f"⚠️ HTTP {response.status_code}")
+            logger.debug("🔍 Récupération: %.60s...", url)
+            client = self._get_client()
+            await self._scrape_rate_limiter.acquire(self._extract_domain(url))
+            async with client.stream('GET', url, timeout=_PAGE_TIMEOUT) as response:
+                if response.status_code != 200:
+                    logger.debug("⚠️ HTTP %s", response.status_code)
                     raise Exception(f"HTTP {response.status_code}")
+                
+                # Pas de téléchargement ni de parsing pour les PDF, images, archives ou pages géantes
+                if not self._is_parsable_response(response):
+                    return self._empty_page_content("failed")
+                
+                html_content = await self._read_capped_body(response)
+            
+            # Parsing (trafilatura + statistiques HTML) dans le pool de threads : la boucle d'événements
+            # continue de servir les autres téléchargements pendant ce travail CPU
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(_PARSE_POOL, self._parse_page_content, html_content, url)
+            word_count = result["word_count"]
+            
+            # 💾 CACHE: Stocker le contenu si valide
+            if word_count > 0:
+                cache_service.set("content", result, url)
+                logger.debug("💾 Cache MISS: %.50s... → stocké 7j", url)
+            
+            return result
 
         except httpx.TimeoutException:
-            print(f"⏱️ Timeout pour {url[:50]}")
+            logger.debug("⏱️ Timeout pour %.50s", url)
             raise Exception("Timeout")
         except Exception as e:
-            print(f"❌ Erreur: {str(e)[:50]}")
+            logger.debug("❌ Erreur: %.50s", e)
             raise
+    
+    def _parse_page_content(self, html_content: str, url: str) -> Dict[str, Any]:
+        """Analyse le HTML d'une page (contenu, métadonnées, statistiques) - exécuté dans _PARSE_POOL"""
+        # NOUVELLE APPROCHE: Extraction avec trafilatura + métadonnées
+        main_content = self._extract_content_with_trafilatura(html_content, url)
+        metadata = self._extract_metadata_with_trafilatura(html_content)
+        
+        # Statistiques HTML (selectolax, ou BeautifulSoup en fallback)
+        html_stats = self._extract_html_stats(html_content)
+        
+        # Comptage des mots basé sur le contenu extrait par trafilatura
+        word_count = len(main_content.split()) if main_content else 0
+        
+        # Validation améliorée de la qualité
+        content_quality = self._validate_content_quality_v2(main_content, word_count, metadata)
+        
+        result = {
+            # Métadonnées extraites par trafilatura
+            "h1": metadata.get('title') or html_stats["h1"],
+            "h2": html_stats["h2"],  # Garde l'ancienne méthode pour H2/H3
+            "h3": html_stats["h3"],
+            
+            # Contenu principal (trafilatura)
+            "content": main_content,
+            "word_count": word_count,
             
+            # Métadonnées enrichies
+            "author": metadata.get('author', ''),
+            "date": metadata.get('date', ''),
+            "description": metadata.get('description', ''),
+            "sitename": metadata.get('sitename', ''),
+            "language": metadata.get('language', 'fr'),
+            
+            # Statistiques HTML
+            "internal_links": html_stats["internal_links"],
+            "external_links": html_stats["external_links"],
+            "images": html_stats["images"],
+            "tables": html_stats["tables"],
+            "lists": html_stats["lists"],
+            "videos": html_stats["videos"],
+            "titles": html_stats["titles"],
+            
+            # Qualité calculée
+            "content_quality": content_quality
+        }
+        
+        logger.debug("✅ OK: %d mots, qualité: %s", word_count, content_quality)
+        return result
+    
+    def _is_parsable_response(self, response: httpx.Response) -> bool:
+        """True si la réponse est du HTML de taille raisonnable (vérifié sur les en-têtes, avant lecture du corps)"""
+        content_type = response.headers.get('content-type', '').split(';')[0].strip().lower()
+        if content_type and content_type not in _HTML_CONTENT_TYPES:
+            logger.debug("⚠️ Contenu non HTML: %.40s", content_type)
+            return False
+        
+        content_length = response.headers.get('content-length', '')
+        if content_length.isdigit() and int(content_length) > _MAX_CONTENT_LENGTH:
+            logger.debug("⚠️ Page trop volumineuse: %s octets", content_length)
+            return False
+        
+        return True
+    
+    def _empty_page_content(self, content_quality: str) -> Dict[str, Any]:
+        """Données de page vides (page ignorée ou non analysable)"""
         return {
             "h1": "",
             "h2": "",
@@ -366,9 +617,31 @@ class ValueSerpService:
             "lists": 0,
             "videos": 0,
             "titles": 0,
-            "content_quality": "failed"
+            "content_quality": content_quality
         }
     
+    async def _read_capped_body(self, response: httpx.Response) -> str:
+        """Lit le corps de la réponse en streaming, tronqué à _MAX_PAGE_BYTES, puis le décode"""
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if len(body) >= _MAX_PAGE_BYTES:
+                logger.debug("✂️ Page tronquée à %d Ko", _MAX_PAGE_BYTES // 1024)
+                del body[_MAX_PAGE_BYTES:]
+                break
+        return body.decode(self._response_encoding(response), errors='replace')
+    
+    def _response_encoding(self, response: httpx.Response) -> str:
+        """Charset déclaré par la réponse, 'utf-8' s'il est absent ou inconnu de Python (comme httpx)"""
+        charset = response.charset_encoding
+        if charset:
+            try:
+                codecs.lookup(charset)
+                return charset
+            except LookupError:
+                logger.debug("⚠️ Charset inconnu: %.40s", charset)
+        return 'utf-8'
+    
     def _validate_content_quality(self, content: str, word_count: int) -> str:
         """Valide la qualité du contenu extrait - Version assouplie"""
         if not content or not content.strip():
@@ -405,28 +678,79 @@ class ValueSerpService:
         else:
             return "short"
 
-    def _extract_domain(self, url: str) -> str:
-        """Extrait le domaine d'une URL"""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_domain(url: str) -> str:
+        """Extrait le domaine d'une URL (mémoïsé : une même URL est analysée plusieurs fois par requête)"""
         try:
-            from urllib.parse import urlparse
             return urlparse(url).netloc
-        except:
+        except Exception:
             return ""
     
-    def _extract_h1(self, soup: BeautifulSoup) -> str:
-        """Extrait le H1 principal"""
-        h1 = soup.find('h1')
-        return h1.get_text().strip() if h1 else ""
+    def _extract_html_stats(self, html_content: str) -> Dict[str, Any]:
+        """Premiers titres H1/H2/H3 et compteurs de balises (liens, images, tableaux...) d'une page"""
+        if not SELECTOLAX_AVAILABLE:
+            return self._extract_html_stats_beautifulsoup(html_content)
+        
+        stats = self._empty_html_stats()
+        
+        # Un seul parcours : le sélecteur groupé renvoie toutes les balises utiles dans l'ordre du document
+        tree = LexborHTMLParser(html_content)
+        for node in tree.css(_STATS_SELECTOR):
+            tag = node.tag
+            if tag == 'a':
+                href = node.attributes.get('href')
+                if href:
+                    stats["external_links" if href.startswith('http') else "internal_links"] += 1
+                continue
+            
+            stats[_STATS_TAG_KEYS[tag]] += 1
+            if tag in _FIRST_HEADING_TAGS and tag not in stats:
+                stats[tag] = node.text().strip()
+        
+        for tag in _FIRST_HEADING_TAGS:
+            stats.setdefault(tag, "")
+        return stats
     
-    def _extract_h2(self, soup: BeautifulSoup) -> str:
-        """Extrait le premier H2"""
-        h2 = soup.find('h2')
-        return h2.get_text().strip() if h2 else ""
+    def _extract_html_stats_beautifulsoup(self, html_content: str) -> Dict[str, Any]:
+        """Fallback BeautifulSoup (lxml) de _extract_html_stats si selectolax n'est pas installé"""
+        stats = self._empty_html_stats()
+        
+        # Un seul parcours de l'arbre (réduit par le strainer) : descendants + test du nom de balise,
+        # sans le filtrage générique de find_all appliqué à chaque nœud
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=_STATS_STRAINER)
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+            tag = element.name
+            if tag == 'a':
+                href = element.get('href')
+                if href:
+                    stats["external_links" if href.startswith('http') else "internal_links"] += 1
+                continue
+            
+            stat_key = _STATS_TAG_KEYS.get(tag)
+            if stat_key is None:
+                continue
+            stats[stat_key] += 1
+            if tag in _FIRST_HEADING_TAGS and tag not in stats:
+                stats[tag] = element.get_text().strip()
+        
+        for tag in _FIRST_HEADING_TAGS:
+            stats.setdefault(tag, "")
+        return stats
     
-    def _extract_h3(self, soup: BeautifulSoup) -> str:
-        """Extrait le premier H3"""
-        h3 = soup.find('h3')
-        return h3.get_text().strip() if h3 else ""
+    def _empty_html_stats(self) -> Dict[str, Any]:
+        """Compteurs de balises à zéro (les titres sont ajoutés au premier H1/H2/H3 rencontré)"""
+        return {
+            "internal_links": 0,
+            "external_links": 0,
+            "images": 0,
+            "tables": 0,
+            "lists": 0,
+            "videos": 0,
+            "titles": 0
+        }
     
     def _extract_content_with_trafilatura(self, html_content: str, url: str = "") -> str:
         """Extrait le contenu principal avec trafilatura hybride intelligent"""
@@ -435,47 +759,33 @@ class ValueSerpService:
             content_precise = self._try_trafilatura_precise(html_content, url)
             
             # STRATÉGIE 2: Si contenu insuffisant, essayer mode agressif
-            if not content_precise or len(content_precise.split()) < 100:
-                print("📄 Contenu trafilatura précis insuffisant, essai mode agressif")
+            # (seuils testés par _has_min_words : découpage borné, pas de split complet de longs contenus)
+            if not content_precise or not _has_min_words(content_precise, 100):
+                logger.debug("📄 Contenu trafilatura précis insuffisant, essai mode agressif")
                 content_aggressive = self._try_trafilatura_aggressive(html_content, url)
                 
-                # Prendre le plus long entre précis et agressif
-                if content_aggressive and len(content_aggressive.split()) > len(content_precise.split() if content_precise else []):
+                # Prendre le plus long entre précis et agressif (le précis fait ici moins de 100 mots)
+                precise_word_count = len(content_precise.split()) if content_precise else 0
+                if content_aggressive and _has_min_words(content_aggressive, precise_word_count + 1):
                     content_precise = content_aggressive
             
             # STRATÉGIE 3: Si toujours insuffisant, utiliser BeautifulSoup hybride
-            if not content_precise or len(content_precise.split()) < 50:
-                print("📄 Trafilatura insuffisant, utilisation BeautifulSoup hybride")
+            if not content_precise or not _has_min_words(content_precise, 50):
+                logger.debug("📄 Trafilatura insuffisant, utilisation BeautifulSoup hybride")
                 return self._extract_content_beautifulsoup_smart(html_content)
             
-            word_count = len(content_precise.split())
-            print(f"📄 Trafilatura hybride: contenu extrait ({word_count} mots)")
+            # Le nombre de mots exact est calculé une seule fois par l'appelant (_parse_page_content)
+            logger.debug("📄 Trafilatura hybride: contenu extrait (%d caractères)", len(content_precise))
             return content_precise.strip()
                 
         except Exception as e:
-            print(f"📄 Erreur trafilatura hybride: {e}, fallback BeautifulSoup")
+            logger.warning("📄 Erreur trafilatura hybride: %s, fallback BeautifulSoup", e)
             return self._extract_content_beautifulsoup_smart(html_content)
     
     def _try_trafilatura_precise(self, html_content: str, url: str) -> str:
         """Trafilatura mode précision"""
         try:
-            config = use_config()
-            config.set('DEFAULT', 'EXTRACTION_TIMEOUT', '30')
-            
-            content = trafilatura.extract(
-                html_content,
-                url=url,
-                config=config,
-                include_comments=False,
-                include_tables=True,
-                include_links=False,
-                include_images=False,
-                include_formatting=False,
-                output_format='txt',
-                target_language='fr',
-                deduplicate=True,
-                favor_precision=True
-            )
+            content = trafilatura.extract(html_content, url=url, config=_PRECISE_CONFIG, **_PRECISE_EXTRACT_KWARGS)
             
             return content or ""
         except:
@@ -484,25 +794,7 @@ class ValueSerpService:
     def _try_trafilatura_aggressive(self, html_content: str, url: str) -> str:
         """Trafilatura mode agressif (plus de contenu)"""
         try:
-            config = use_config()
-            config.set('DEFAULT', 'MIN_EXTRACTED_SIZE', '25')  # Seuil plus bas
-            config.set('DEFAULT', 'MIN_OUTPUT_SIZE', '25')
-            
-            content = trafilatura.extract(
-                html_content,
-                url=url,
-                config=config,
-                include_comments=False,
-                include_tables=True,
-                include_links=True,        # INCLURE LIENS
-                include_images=False,
-                include_formatting=True,   # INCLURE FORMATAGE
-                output_format='txt',
-                target_language=None,      # PAS DE FILTRE LANGUE
-                deduplicate=False,         # PAS DE DÉDUPLICATION
-                favor_precision=False,     # PRIVILÉGIER RAPPEL
-                favor_recall=True
-            )
+            content = trafilatura.extract(html_content, url=url, config=_AGGRESSIVE_CONFIG, **_AGGRESSIVE_EXTRACT_KWARGS)
             
             return content or ""
         except:
@@ -511,7 +803,8 @@ class ValueSerpService:
     def _extract_content_beautifulsoup_smart(self, html_content: str) -> str:
         """BeautifulSoup intelligent avec stratégie progressive"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            # Un seul parsing (lxml) pour les trois stratégies
+            soup = BeautifulSoup(html_content, 'lxml')
             
             # STRATÉGIE 1: Essai avec sélecteurs standards (sans suppression)
             standard_selectors = ['main', 'article', '[role="main"]', '.main-content', '.content', '.entry-content']
@@ -520,18 +813,19 @@ class ValueSerpService:
                 elements = soup.select(selector)
                 if elements:
                     best_element = max(elements, key=lambda e: len(e.get_text()))
-                    content = best_element.get_text(separator=' ', strip=True)
+                    content = self._bounded_text(best_element)
                     word_count = len(content.split())
                     
                     if word_count >= 100:  # Contenu substantiel
-                        print(f"📄 BeautifulSoup smart: sélecteur standard '{selector}' ({word_count} mots)")
+                        logger.debug("📄 BeautifulSoup smart: sélecteur standard '%s' (%d mots)", selector, word_count)
                         return self._smart_clean_text(content)
             
             # STRATÉGIE 2: Body complet avec nettoyage léger
-            print("📄 BeautifulSoup smart: utilisation du body avec nettoyage léger")
+            logger.debug("📄 BeautifulSoup smart: utilisation du body avec nettoyage léger")
             
-            # Copie pour nettoyage
-            soup_clean = BeautifulSoup(html_content, 'html.parser')
+            # Texte brut du body (stratégie 3) relevé avant le nettoyage : évite un second parsing du document
+            raw_body = soup.find('body')
+            raw_content = self._bounded_text(raw_body) if raw_body else None
             
             # Suppression minimale et intelligente
             elements_to_remove = [
@@ -547,37 +841,45 @@ class ValueSerpService:
             ]
             
             for selector in elements_to_remove:
-                for element in soup_clean.select(selector):
+                for element in soup.select(selector):
                     element.decompose()
             
             # Extraction du body nettoyé
-            body = soup_clean.find('body')
-            if body:
-                content = body.get_text(separator=' ', strip=True)
+            if raw_body:
+                content = self._bounded_text(raw_body)
                 content = self._smart_clean_text(content)
                 word_count = len(content.split())
                 
                 if word_count >= 50:
-                    print(f"📄 BeautifulSoup smart: body nettoyé ({word_count} mots)")
+                    logger.debug("📄 BeautifulSoup smart: body nettoyé (%d mots)", word_count)
                     return content
             
             # STRATÉGIE 3: Body brut en dernier recours
-            print("📄 BeautifulSoup smart: body brut en dernier recours")
-            raw_body = soup.find('body')
-            if raw_body:
-                content = raw_body.get_text(separator=' ', strip=True)
-                content = self._smart_clean_text(content)
+            logger.debug("📄 BeautifulSoup smart: body brut en dernier recours")
+            if raw_content is not None:
+                content = self._smart_clean_text(raw_content)
                 word_count = len(content.split())
                 
-                print(f"📄 BeautifulSoup smart: body brut ({word_count} mots)")
+                logger.debug("📄 BeautifulSoup smart: body brut (%d mots)", word_count)
                 return content
             
             return ""
             
         except Exception as e:
-            print(f"📄 Erreur BeautifulSoup smart: {e}")
+            logger.warning("📄 Erreur BeautifulSoup smart: %s", e)
             return ""
     
+    def _bounded_text(self, element, max_words: int = _MAX_TEXT_WORDS) -> str:
+        """Équivalent de get_text(separator=' ', strip=True), arrêté dès que max_words mots sont collectés"""
+        parts = []
+        word_count = 0
+        for text in element.stripped_strings:
+            parts.append(text)
+            word_count += len(text.split())
+            if word_count >= max_words:
+                break
+        return ' '.join(parts)
+    
     def _smart_clean_text(self, text: str) -> str:
         """Nettoyage intelligent du texte extrait"""
         import re
@@ -613,19 +915,6 @@ class ValueSerpService:
         html_content = str(soup)
         return self._extract_content_with_trafilatura(html_content)
     
-    def _count_words(self, soup: BeautifulSoup) -> int:
-        """Compte le nombre de mots dans le contenu principal"""
-        text = self._extract_content(soup)
-        if not text.strip():
-            return 0
-        
-        # Nettoyage du texte pour un comptage plus précis
-        clean_text = ' '.join(text.split())  # Supprime les espaces multiples
-        word_count = len(clean_text.split())
-        
-        print(f"📊 Nombre de mots dans le contenu principal: {word_count}")
-        return word_count
-    
     def _extract_metadata_with_trafilatura(self, html_content: str) -> Dict[str, str]:
         """Extrait les métadonnées avec trafilatura"""
         try:
@@ -647,7 +936,7 @@ class ValueSerpService:
                 return {}
                 
         except Exception as e:
-            print(f"📄 Erreur extraction métadonnées: {e}")
+            logger.warning("📄 Erreur extraction métadonnées: %s", e)
             return {}
     
     def _validate_content_quality_v2(self, content: str, word_count: int, metadata: Dict[str, str]) -> str:
@@ -707,56 +996,39 @@ class ValueSerpService:
         return "good" if word_count >= 300 else "acceptable"
     
     def _count_words_from_content(self, content: str) -> int:
-        """Compte les mots directement depuis le contenu extrait"""
-        if not content or not content.strip():
+        """Compte les mots directement depuis le contenu extrait (un seul split, sans re-extraction)"""
+        if not content:
             return 0
         
-        # Nettoyage et comptage plus précis
-        clean_content = ' '.join(content.split())  # Normalise les espaces
-        word_count = len(clean_content.split())
+        # split() sans argument ignore déjà les espaces multiples : pas de normalisation préalable
+        word_count = len(content.split())
         
-        print(f"📊 Nombre de mots dans le contenu extrait: {word_count}")
+        logger.debug("📊 Nombre de mots dans le contenu extrait: %d", word_count)
         return word_count
     
     def _extract_paa(self, serp_data: Dict[str, Any]) -> List[str]:
         """Extrait les questions People Also Ask (related_questions dans ValueSERP)"""
-        paa_questions = []
-        
-        print(f"🔍 Clés dans serp_data: {list(serp_data.keys())}")
+        logger.debug("🔍 Clés dans serp_data: %s", list(serp_data))
         
         # ValueSERP utilise "related_questions" pour les PAA
-        if "related_questions" in serp_data and serp_data["related_questions"]:
-            print(f"✅ Trouvé related_questions avec {len(serp_data['related_questions'])} éléments")
-            
-            for paa_item in serp_data["related_questions"]:
-                if isinstance(paa_item, dict):
-                    if "question" in paa_item:
-                        paa_questions.append(paa_item["question"])
-                        print(f"📋 Question extraite: {paa_item['question']}")
-                    elif "title" in paa_item:
-                        paa_questions.append(paa_item["title"])
-        else:
-            print("❌ Aucune related_questions trouvée")
+        paa_questions = [
+            question
+            for paa_item in serp_data.get("related_questions") or ()
+            if isinstance(paa_item, dict) and (question := _first_field(paa_item, _PAA_FIELDS)) is not _MISSING
+        ]
         
-        print(f"📋 Total PAA extraites: {len(paa_questions)}")
+        logger.debug("📋 Total PAA extraites: %d", len(paa_questions))
         return paa_questions
     
     def _extract_related_searches(self, serp_data: Dict[str, Any]) -> List[str]:
         """Extrait les recherches associées"""
-        related_searches = []
-        
-        if "related_searches" in serp_data and serp_data["related_searches"]:
-            print(f"✅ Trouvé related_searches avec {len(serp_data['related_searches'])} éléments")
-            
-            for search_item in serp_data["related_searches"]:
-                if isinstance(search_item, dict):
-                    if "query" in search_item:
-                        related_searches.append(search_item["query"])
-                    elif "title" in search_item:
-                        related_searches.append(search_item["title"])
-                elif isinstance(search_item, str):
-                    related_searches.append(search_item)
+        related_searches = [
+            search
+            for search in map(_related_search_text, serp_data.get("related_searches") or ())
+            if search is not _MISSING
+        ]
         
+        logger.debug("✅ Recherches associées extraites: %d", len(related_searches))
         return related_searches
     
     def _clean_wikipedia_text(self, text: str) -> str:
@@ -815,22 +1087,13 @@ class ValueSerpService:
     
     def _extract_inline_videos(self, serp_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extrait les vidéos intégrées"""
-        videos = []
-        
-        if "inline_videos" in serp_data and serp_data["inline_videos"]:
-            print(f"✅ Trouvé inline_videos avec {len(serp_data['inline_videos'])} éléments")
-            
-            for video_item in serp_data["inline_videos"]:
-                if isinstance(video_item, dict):
-                    video_data = {
-                        "title": video_item.get("title", ""),
-                        "link": video_item.get("link", ""),
-                        "thumbnail": video_item.get("thumbnail", ""),
-                        "duration": video_item.get("duration", ""),
-                        "source": video_item.get("source", "")
-                    }
-                    videos.append(video_data)
+        videos = [
+            {field: video_item.get(field, "") for field in _INLINE_VIDEO_FIELDS}
+            for video_item in serp_data.get("inline_videos") or ()
+            if isinstance(video_item, dict)
+        ]
         
+        logger.debug("✅ Vidéos intégrées extraites: %d", len(videos))
         return videos
     
     def _get_demo_data(self, query: str) -> Dict[str, Any]:
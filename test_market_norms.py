@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Script de test pour les seuils adaptatifs du marché (_analyze_market_norms)
+"""
+import random
+from collections import Counter
+
+from services.seo_analyzer import SEOAnalyzer
+
+VOCABULARY = [
+    "créatine", "whey", "bcaa", "musculation", "protéine", "récupération",
+    "dosage", "cure", "masse", "sport", "performance", "complément",
+]
+
+def reference_market_thresholds(analyzer, serp_results, keywords):
+    """Implémentation de référence : listes de valeurs par mot-clé, statistiques mot-clé par mot-clé"""
+    market_densities = {}
+    market_frequencies = {}
+    total_densities = []
+
+    for result in serp_results:
+        if not result.get("url"):
+            continue
+        full_content = " ".join([
+            result.get("title", ""), result.get("h1", ""), result.get("h2", ""),
+            result.get("h3", ""), result.get("content", ""), result.get("snippet", "")
+        ])
+        content_words = analyzer._tokenize_and_filter(full_content)
+        word_counts = Counter(content_words)
+        total_words = len(content_words)
+        if total_words == 0:
+            continue
+
+        competitor_total_density = 0
+        for keyword_info in keywords[:15]:
+            keyword = keyword_info[0].lower()
+            frequency = word_counts.get(keyword, 0)
+            density = (frequency / total_words) * 100 if frequency > 0 else 0
+            market_densities.setdefault(keyword, []).append(density)
+            market_frequencies.setdefault(keyword, []).append(frequency)
+            competitor_total_density += density
+        total_densities.append(competitor_total_density)
+
+    thresholds = {}
+    for keyword in market_densities:
+        densities = [d for d in market_densities[keyword] if d > 0]
+        frequencies = [f for f in market_frequencies[keyword] if f > 0]
+        if not densities:
+            continue
+        sorted_densities = sorted(densities)
+        sorted_frequencies = sorted(frequencies)
+        mean_density = sum(densities) / len(densities)
+        max_density = max(densities)
+        mean_frequency = sum(frequencies) / len(frequencies)
+        max_frequency = max(frequencies)
+        p75_density = sorted_densities[int(len(sorted_densities) * 0.75)] if len(sorted_densities) > 3 else max_density
+        p90_density = sorted_densities[int(len(sorted_densities) * 0.90)] if len(sorted_densities) > 9 else max_density
+        p75_frequency = sorted_frequencies[int(len(sorted_frequencies) * 0.75)] if len(sorted_frequencies) > 3 else max_frequency
+        p90_frequency = sorted_frequencies[int(len(sorted_frequencies) * 0.90)] if len(sorted_frequencies) > 9 else max_frequency
+        thresholds[keyword] = {
+            'density_moderate': max(p75_density * 1.3, mean_density + 1.0),
+            'density_high': max(p90_density * 1.2, mean_density + 2.0),
+            'density_critical': max(max_density * 1.1, mean_density + 3.0),
+            'frequency_moderate': max(p75_frequency * 1.5, mean_frequency + 5),
+            'frequency_high': max(p90_frequency * 1.3, mean_frequency + 10),
+            'frequency_critical': max(max_frequency * 1.2, mean_frequency + 15),
+            'market_min_density': min(densities),
+            'market_max_density': max_density,
+            'market_median_density': sorted_densities[len(sorted_densities) // 2],
+            'market_mean_density': mean_density,
+            'market_min_frequency': min(frequencies),
+            'market_max_frequency': max_frequency,
+            'market_median_frequency': sorted_frequencies[len(sorted_frequencies) // 2],
+            'market_mean_frequency': mean_frequency
+        }
+    return thresholds, total_densities
+
+def _random_serp(rng, competitor_count):
+    """Résultats SERP aléatoires (contenus vides et résultats sans URL inclus)"""
+    serp_results = []
+    for position in range(competitor_count):
+        words = [rng.choice(VOCABULARY) for _ in range(rng.choice([0, 5, 40, 200]))]
+        serp_results.append({
+            "url": f"https://example{position}.com" if rng.random() > 0.1 else "",
+            "title": rng.choice(VOCABULARY),
+            "content": " ".join(words),
+        })
+    return serp_results
+
+def test_market_thresholds_equivalence():
+    """Compare les seuils adaptatifs à la référence (mots-clés répétés, moins de 4 ou 10 concurrents)"""
+    analyzer = SEOAnalyzer()
+    rng = random.Random(7)
+
+    print("🧪 Test des seuils adaptatifs du marché")
+    print("=" * 60)
+
+    for competitor_count in [0, 1, 2, 3, 4, 5, 9, 10, 12, 20] * 5:
+        serp_results = _random_serp(rng, competitor_count)
+        # Mots-clés répétés (casse différente) et absents des contenus
+        keywords = [[rng.choice(VOCABULARY + ["inexistant"]).capitalize() if rng.random() < 0.3
+                     else rng.choice(VOCABULARY), 1, 10] for _ in range(rng.randint(0, 18))]
+
+        expected_thresholds, expected_totals = reference_market_thresholds(analyzer, serp_results, keywords)
+        market_data = analyzer._analyze_market_norms(serp_results, keywords)
+
+        assert market_data["keyword_thresholds"] == expected_thresholds, (competitor_count, keywords)
+        if expected_totals:
+            assert market_data["total_density_thresholds"]["market_max"] == max(expected_totals)
+
+    print("✅ Seuils identiques à la référence mot-clé par mot-clé")
+
+if __name__ == "__main__":
+    test_market_thresholds_equivalence()
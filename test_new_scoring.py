@@ -45,6 +45,93 @@ def test_detect_keyword_hybrid():
     
     print()
 
+def test_keyword_window_counts():
+    """Test du comptage par fenêtres (Aho-Corasick) utilisé par le score"""
+    print("🪟 TEST COMPTAGE PAR FENÊTRES")
+    print("=" * 50)
+    
+    from services.seo_analyzer import AHOCORASICK_AVAILABLE
+    
+    analyzer = SEOAnalyzer()
+    
+    # (contenu, mot-clé, fenêtres candidates, occurrences validées)
+    cases = [
+        # Multi-mots
+        ("La créatine monohydrate améliore. Le créatine monohydrate est efficace.", "créatine monohydrate", 2, 2),
+        ("Prise de masse : la prise de masse sèche, prise de masse.", "prise de masse", 3, 3),
+        # Accents (contenu et mot-clé)
+        ("La créatinë monohydraté améliore. Créatine monohydrate recommandé.", "créatine monohydrate", 2, 2),
+        ("Une cure de creatine, puis une cure de créatine.", "cure de créatine", 2, 2),
+        # Tirets et apostrophes (gardés dans les tokens normalisés)
+        ("Le produit anti-âge est efficace. Les crèmes anti-âge fonctionnent, anti âge aussi.", "anti-âge", 2, 2),
+        ("Le produit anti-âge est efficace. Les crèmes anti age fonctionnent.", "anti âge", 1, 1),
+        ("E-commerce, e commerce et ecommerce.", "e-commerce", 1, 1),
+        ("Avant l'entraînement, puis l entraînement.", "l'entraînement", 1, 1),
+        # Pas de correspondance à l'intérieur d'un mot ou d'un token composé
+        ("Les bcaas et les BCAA, pas les xbcaa.", "bcaa", 1, 1),
+        ("supercréatinemonohydrateplus créatine-monohydrate", "créatine monohydrate", 0, 0),
+        # Fenêtres chevauchantes : la validation regex ne compte que les occurrences disjointes
+        ("très très très bien", "très très", 2, 1),
+    ]
+    
+    for content, keyword, expected_windows, expected in cases:
+        scoring_keywords = analyzer._prepare_scoring_keywords([[keyword, 1, 10, expected, expected]], [])
+        normalized_content = analyzer._normalize_for_detection(content)
+        
+        if AHOCORASICK_AVAILABLE:
+            windows = analyzer._count_keyword_windows(normalized_content, scoring_keywords)
+            assert windows.get(scoring_keywords[0].parts, 0) == expected_windows, (keyword, windows)
+        
+        detected = analyzer._detect_keyword_hybrid(content, keyword)
+        # Score 100 uniquement si le comptage du score tombe exactement sur `expected` (min = max = expected)
+        score = analyzer._calculate_seo_score(content, [[keyword, 1, 10, expected, expected]], [], scoring_keywords)
+        print(f"✅ '{keyword}' : {detected} occurrences, score {score} (attendu: {expected}, score 100)")
+        assert detected == expected, (keyword, detected)
+        assert score == 100, (keyword, score)
+    
+    print()
+
+def test_keyword_automaton_cache_eviction():
+    """Test du cache LRU des automates de mots-clés (analyseur partagé entre les requêtes)"""
+    print("🗄️ TEST CACHE DES AUTOMATES")
+    print("=" * 50)
+    
+    from services.seo_analyzer import AHOCORASICK_AVAILABLE, _AUTOMATON_CACHE_SIZE
+    
+    if not AHOCORASICK_AVAILABLE:
+        print("⏭️ pyahocorasick absent, test ignoré")
+        print()
+        return
+    
+    analyzer = SEOAnalyzer()
+    first_keywords = ["mot 0", "clé 0"]
+    first = analyzer._get_keyword_automaton(first_keywords)
+    
+    # Bien plus de jeux distincts que la capacité : les nouveaux jeux restent mis en cache
+    for i in range(1, _AUTOMATON_CACHE_SIZE * 2):
+        keywords = [f"mot {i}", f"clé {i}"]
+        automaton = analyzer._get_keyword_automaton(keywords)
+        assert analyzer._get_keyword_automaton(keywords) is automaton, i
+        assert len(analyzer._automaton_cache) <= _AUTOMATON_CACHE_SIZE
+    
+    # Le jeu le plus ancien a été évincé, le plus récent est toujours servi par le cache
+    assert frozenset(first_keywords) not in analyzer._automaton_cache
+    assert analyzer._get_keyword_automaton(first_keywords) is not first
+    print(f"✅ {_AUTOMATON_CACHE_SIZE * 2} jeux de mots-clés : cache plein mais toujours alimenté")
+    
+    # Comptage par fenêtres du score : un seul automate pour tous les concurrents, même cache plein
+    scoring_keywords = analyzer._prepare_scoring_keywords([["créatine monohydrate", 1, 10, 1, 3]], [["prise de masse", 1, 5, 1, 2]])
+    contents = ["la créatine monohydrate aide la prise de masse", "prise de masse sans créatine"]
+    windows = [analyzer._count_keyword_windows(analyzer._normalize_for_detection(c), scoring_keywords) for c in contents]
+    patterns = [f" {' '.join(sk.parts)} " for sk in scoring_keywords]
+    cached = analyzer._automaton_cache[frozenset(patterns)]
+    assert analyzer._get_keyword_automaton(patterns) is cached
+    assert windows[0] == {("creatine", "monohydrate"): 1, ("prise", "de", "masse"): 1}, windows[0]
+    assert windows[1] == {("prise", "de", "masse"): 1}, windows[1]
+    print("✅ Comptage par fenêtres : automate réutilisé d'un concurrent à l'autre")
+    
+    print()
+
 def test_calculate_seo_score():
     """Test du calcul de score 70/30"""
     print("📊 TEST CALCUL SCORE 70/30")
@@ -240,6 +327,8 @@ async def main():
     
     # Tests unitaires
     test_detect_keyword_hybrid()
+    test_keyword_window_counts()
+    test_keyword_automaton_cache_eviction()
     test_calculate_seo_score()
     test_suroptimization_penalty()
     
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Script de test pour le comptage des n-grams sur identifiants entiers (_count_ngrams)
+"""
+import random
+from collections import Counter
+
+from services.seo_analyzer import SEOAnalyzer
+
+# Vocabulaire réduit : beaucoup de répétitions et d'égalités de fréquence,
+# mots courts pour exercer le filtre de longueur
+VOCABULARY = [
+    "de", "la", "le", "et", "créatine", "whey", "bcaa", "musculation", "prise",
+    "masse", "dosage", "cure", "effets", "sport", "récupération", "ou", "à",
+]
+
+def reference_count_ngrams(words, n, min_length, top_k, min_count=1):
+    """Implémentation de référence : Counter sur les tuples de mots, ordre de most_common"""
+    counts = Counter(
+        gram for gram in zip(*(words[j:] for j in range(n)))
+        if len(" ".join(gram)) > min_length
+    )
+    top_ngrams = [(" ".join(gram), freq) for gram, freq in counts.most_common() if freq >= min_count]
+    return top_ngrams[:top_k], len(counts)
+
+def test_count_ngrams_equivalence():
+    """Compare _count_ngrams à la référence Counter sur des textes aléatoires"""
+    analyzer = SEOAnalyzer()
+    rng = random.Random(42)
+
+    print("🧪 Test du comptage des n-grams (_count_ngrams vs Counter)")
+    print("=" * 60)
+
+    cases = 0
+    for _ in range(300):
+        vocabulary = rng.sample(VOCABULARY, rng.randint(2, len(VOCABULARY)))
+        words = [rng.choice(vocabulary) for _ in range(rng.randint(0, 400))]
+        n = rng.choice([2, 3])
+        min_length = rng.choice([0, 6, 10, 14])
+        top_k = rng.choice([1, 3, 10, 150, 200])
+        min_count = rng.choice([1, 2, 3])
+
+        expected = reference_count_ngrams(words, n, min_length, top_k, min_count)
+        result = analyzer._count_ngrams(words, n, min_length, top_k, min_count=min_count)
+        assert result == expected, (n, min_length, top_k, min_count, words)
+        cases += 1
+
+    print(f"✅ {cases} cas identiques (top_k, min_count, égalités de fréquence)")
+
+def test_count_ngrams_ties():
+    """Les égalités de fréquence gardent l'ordre de première apparition"""
+    analyzer = SEOAnalyzer()
+    words = "cure whey dosage masse cure whey dosage masse prise masse prise masse".split()
+
+    top_ngrams, distinct_count = analyzer._count_ngrams(words, 2, 0, 3, min_count=2)
+
+    print(f"📋 Top bigrammes avec égalités: {top_ngrams}")
+    # 5 bigrammes à égalité (2 occurrences) : les 3 premiers apparus sont retenus, "masse cure" (1) est écarté
+    assert top_ngrams == [("cure whey", 2), ("whey dosage", 2), ("dosage masse", 2)]
+    assert distinct_count == 6
+
+if __name__ == "__main__":
+    test_count_ngrams_equivalence()
+    test_count_ngrams_ties()
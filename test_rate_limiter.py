@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+🧪 Tests des limiteurs de débit (token bucket) - horloge simulée, sans attente réelle
+"""
+import asyncio
+import sys
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services import rate_limiter
+from services.rate_limiter import RateLimiter, DomainRateLimiter
+
+class _FakeClock:
+    """Remplace time.monotonic et asyncio.sleep du module : chaque attente avance l'horloge"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+        self.blocked = False
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float):
+        self.sleeps.append(round(delay, 6))
+        if self.blocked:
+            # Attente qui ne se termine jamais (l'appelant sera annulé)
+            await asyncio.get_running_loop().create_future()
+        self.now += delay
+
+    def patch(self):
+        fake_asyncio = SimpleNamespace(sleep=self.sleep, CancelledError=asyncio.CancelledError)
+        return patch.multiple(
+            rate_limiter, time=SimpleNamespace(monotonic=self.monotonic), asyncio=fake_asyncio
+        )
+
+def test_burst_then_pacing():
+    """Rafale jusqu'à la capacité sans attente, puis un appel toutes les 1/rate secondes"""
+    print("🪣 TEST RAFALE PUIS CADENCE")
+    print("=" * 50)
+
+    clock = _FakeClock()
+
+    async def scenario():
+        limiter = RateLimiter(rate=5, capacity=3)
+        for _ in range(6):
+            await limiter.acquire()
+
+    with clock.patch():
+        asyncio.run(scenario())
+
+    print(f"✅ Attentes: {clock.sleeps}")
+    assert clock.sleeps == [0.2, 0.2, 0.2]
+
+    # Après une pause, le seau se remplit à nouveau jusqu'à la capacité (pas au-delà)
+    clock.sleeps.clear()
+
+    async def after_pause():
+        limiter = RateLimiter(rate=5, capacity=3)
+        for _ in range(3):
+            await limiter.acquire()
+        clock.now += 60
+        for _ in range(4):
+            await limiter.acquire()
+
+    with clock.patch():
+        asyncio.run(after_pause())
+
+    print(f"✅ Attentes après pause: {clock.sleeps}")
+    assert clock.sleeps == [0.2]
+    print()
+
+def test_domains_independent():
+    """Chaque domaine a son propre seau : un domaine saturé ne ralentit pas les autres"""
+    print("🌐 TEST DOMAINES INDÉPENDANTS")
+    print("=" * 50)
+
+    clock = _FakeClock()
+
+    async def scenario():
+        limiter = DomainRateLimiter(rate=2)
+        for domain in ["a.example.com", "b.example.com", "a.example.com", "b.example.com"]:
+            await limiter.acquire(domain)
+        assert clock.sleeps == []
+        await limiter.acquire("a.example.com")
+        await limiter.acquire("c.example.com")
+
+    with clock.patch():
+        asyncio.run(scenario())
+
+    print(f"✅ Attentes: {clock.sleeps}")
+    assert clock.sleeps == [0.5]
+    print()
+
+def test_cancelled_waiter_refunds_token():
+    """Un appelant annulé pendant son attente rend son jeton : le suivant n'attend pas en plus"""
+    print("🛑 TEST ANNULATION PENDANT L'ATTENTE")
+    print("=" * 50)
+
+    clock = _FakeClock()
+
+    async def scenario():
+        limiter = RateLimiter(rate=1, capacity=1)
+        await limiter.acquire()
+
+        clock.blocked = True
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            pass
+        clock.blocked = False
+
+        await limiter.acquire()
+
+    with clock.patch():
+        asyncio.run(scenario())
+
+    print(f"✅ Attentes: {clock.sleeps}")
+    # Sans remboursement, le second appel attendrait 2 s (jeton de l'appelant annulé perdu)
+    assert clock.sleeps == [1.0, 1.0]
+    print()
+
+if __name__ == "__main__":
+    test_burst_then_pacing()
+    test_domains_independent()
+    test_cancelled_waiter_refunds_token()
+    print("🏁 TESTS TERMINÉS")
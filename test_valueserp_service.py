@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+🧪 Tests du scraping des pages (ValueSerpService) - sans accès réseau
+"""
+import asyncio
+import sys
+import os
+import uuid
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+
+from services.valueserp_service import ValueSerpService
+
+PAGE_HTML = """
+<html><head><title>Créatine</title></head><body>
+<h1>Guide de la créatine</h1>
+<p>La créatine est un complément très étudié pour la musculation.</p>
+</body></html>
+"""
+
+def _make_service(content_type: str, body: bytes) -> ValueSerpService:
+    """Service dont le client HTTP répond toujours `body` avec le Content-Type donné"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": content_type}, content=body)
+
+    return ValueSerpService(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+async def _download(service: ValueSerpService, url: str):
+    async with service:
+        return await service._download_page_content(url)
+
+def test_unknown_charset():
+    """Un charset inconnu de Python (utf8mb4) retombe sur utf-8 au lieu de faire échouer le scraping"""
+    print("🔤 TEST CHARSET INCONNU")
+    print("=" * 50)
+
+    service = _make_service("text/html; charset=utf8mb4", PAGE_HTML.encode("utf-8"))
+    result = asyncio.run(_download(service, "https://example.com/charset-inconnu"))
+
+    print(f"✅ H1: {result['h1']!r}, {result['word_count']} mots")
+    assert "créatine" in result["h1"].lower()
+    assert result["word_count"] > 0
+    print()
+
+def test_known_charset():
+    """Un charset connu est respecté (latin-1 décodé sans caractères de remplacement)"""
+    print("🔤 TEST CHARSET CONNU")
+    print("=" * 50)
+
+    service = _make_service("text/html; charset=iso-8859-1", PAGE_HTML.encode("iso-8859-1"))
+    result = asyncio.run(_download(service, "https://example.com/charset-latin1"))
+
+    print(f"✅ H1: {result['h1']!r}")
+    assert "créatine" in result["h1"].lower()
+    assert "�" not in result["h1"]
+    print()
+
+class _StubDownload:
+    """Remplace _download_page_content : compte les appels et attend `release` avant de répondre"""
+
+    def __init__(self, error: Exception = None):
+        self.calls = 0
+        self.error = error
+        self.release = asyncio.Event()
+
+    async def __call__(self, url: str):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return {"url": url, "word_count": 42}
+
+def _unique_url() -> str:
+    """URL jamais vue (le cache de contenu ne doit pas répondre à la place du téléchargement)"""
+    return f"https://example.com/{uuid.uuid4().hex}"
+
+async def _start_fetches(service: ValueSerpService, url: str, count: int):
+    """Lance `count` appels concurrents et laisse la boucle les mettre en attente"""
+    tasks = [asyncio.create_task(service._fetch_page_content(url)) for _ in range(count)]
+    await asyncio.sleep(0)
+    return tasks
+
+def test_inflight_fetch_shared():
+    """Les appels concurrents sur une même URL partagent un seul téléchargement"""
+    print("🔗 TEST SCRAPING PARTAGÉ")
+    print("=" * 50)
+
+    async def scenario():
+        service = ValueSerpService()
+        service._download_page_content = stub = _StubDownload()
+        url = _unique_url()
+
+        tasks = await _start_fetches(service, url, 3)
+        assert url in service._inflight_fetches
+        stub.release.set()
+        results = await asyncio.gather(*tasks)
+
+        print(f"✅ {len(tasks)} appels, {stub.calls} téléchargement(s)")
+        assert stub.calls == 1
+        assert all(result is results[0] for result in results)
+        assert service._inflight_fetches == {}
+
+    asyncio.run(scenario())
+    print()
+
+def test_inflight_fetch_error():
+    """L'erreur du téléchargement partagé atteint chaque appelant, sans entrée résiduelle"""
+    print("❌ TEST ERREUR PARTAGÉE")
+    print("=" * 50)
+
+    async def scenario():
+        service = ValueSerpService()
+        service._download_page_content = stub = _StubDownload(error=Exception("HTTP 503"))
+        url = _unique_url()
+
+        tasks = await _start_fetches(service, url, 3)
+        stub.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        print(f"✅ Erreurs reçues: {[str(result) for result in results]}")
+        assert stub.calls == 1
+        assert all(isinstance(result, Exception) and str(result) == "HTTP 503" for result in results)
+        assert service._inflight_fetches == {}
+
+        # Une nouvelle demande relance un téléchargement (l'échec n'est pas mémorisé)
+        stub.error = None
+        assert (await service._fetch_page_content(url))["word_count"] == 42
+        assert stub.calls == 2
+
+    asyncio.run(scenario())
+    print()
+
+def test_inflight_fetch_cancelled_caller():
+    """L'annulation d'un appelant n'interrompt pas le téléchargement des autres"""
+    print("🛑 TEST APPELANT ANNULÉ")
+    print("=" * 50)
+
+    async def scenario():
+        service = ValueSerpService()
+        service._download_page_content = stub = _StubDownload()
+        url = _unique_url()
+
+        cancelled, *others = await _start_fetches(service, url, 3)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        stub.release.set()
+        results = await asyncio.gather(*others)
+
+        print(f"✅ Appelant annulé: {cancelled.cancelled()}, autres: {[result['word_count'] for result in results]}")
+        assert cancelled.cancelled()
+        assert stub.calls == 1
+        assert all(result["word_count"] == 42 for result in results)
+        assert service._inflight_fetches == {}
+
+    asyncio.run(scenario())
+    print()
+
+if __name__ == "__main__":
+    test_unknown_charset()
+    test_known_charset()
+    test_inflight_fetch_shared()
+    test_inflight_fetch_error()
+    test_inflight_fetch_cancelled_caller()
+    print("🏁 TESTS TERMINÉS")